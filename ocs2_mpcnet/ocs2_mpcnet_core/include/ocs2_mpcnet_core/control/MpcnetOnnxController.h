@@ -55,6 +55,7 @@ inline std::shared_ptr<Ort::Env> createOnnxEnvironment() {
  * x: relative state (1 x dimensionOfState),
  * u: predicted input (1 x dimensionOfInput),
  * @note The additional first dimension with size 1 for the variables of the model comes from batch processing during training.
+ * @note The input and output tensors are allocated once when loading the policy model and are reused for every inference.
  */
 class MpcnetOnnxController final : public MpcnetControllerBase {
  public:
@@ -105,6 +106,10 @@ class MpcnetOnnxController final : public MpcnetControllerBase {
   std::vector<const char*> outputNames_;
   std::vector<std::vector<int64_t>> inputShapes_;
   std::vector<std::vector<int64_t>> outputShapes_;
+  Eigen::Matrix<tensor_element_t, Eigen::Dynamic, 1> observation_;
+  Eigen::Matrix<tensor_element_t, Eigen::Dynamic, 1> action_;
+  std::vector<Ort::Value> inputValues_;
+  std::vector<Ort::Value> outputValues_;
 };
 
 }  // namespace mpcnet
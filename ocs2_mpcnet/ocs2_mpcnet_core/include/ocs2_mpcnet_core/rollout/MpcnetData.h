@@ -31,6 +31,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include <ocs2_core/Types.h>
 #include <ocs2_mpc/MPC_BASE.h>
+#include <ocs2_oc/oc_data/PrimalSolution.h>
 
 #include "ocs2_mpcnet_core/MpcnetDefinitionBase.h"
 
@@ -63,13 +64,14 @@ using data_array_t = std::vector<data_point_t>;
  * Get a data point.
  * @param [in] mpc : The MPC with a pointer to the underlying solver.
  * @param [in] mpcnetDefinition : The MPC-Net definitions.
+ * @param [in] primalSolution : The primal solution of the MPC, which is shared by all data points of one MPC iteration.
  * @param [in] deviation : The state deviation from the nominal state where to get the data point from.
  * @return A data point.
  */
-inline data_point_t getDataPoint(MPC_BASE& mpc, MpcnetDefinitionBase& mpcnetDefinition, const vector_t& deviation) {
+inline data_point_t getDataPoint(MPC_BASE& mpc, MpcnetDefinitionBase& mpcnetDefinition, const PrimalSolution& primalSolution,
+                                 const vector_t& deviation) {
   data_point_t dataPoint;
   const auto& referenceManager = mpc.getSolverPtr()->getReferenceManager();
-  const auto primalSolution = mpc.getSolverPtr()->primalSolution(mpc.getSolverPtr()->getFinalTime());
   dataPoint.t = primalSolution.timeTrajectory_.front();
   dataPoint.x = primalSolution.stateTrajectory_.front() + deviation;
   dataPoint.u = primalSolution.controllerPtr_->computeInput(dataPoint.t, dataPoint.x);
@@ -32,6 +32,7 @@
 Provides helper functions, such as convenience functions for batch-wise operations or access to OCC2 types.
 """
 
+import copy
 import torch
 import numpy as np
 from typing import Tuple, Dict
@@ -81,6 +82,24 @@ def bmv(bm: torch.Tensor, bv: torch.Tensor) -> torch.Tensor:
     return torch.matmul(bm, bv.unsqueeze(dim=2)).squeeze(dim=2)
 
 
+def baddbmv(bv1: torch.Tensor, bm: torch.Tensor, bv2: torch.Tensor) -> torch.Tensor:
+    """Batch-wise matrix-vector product plus vector.
+
+    Performs a batch-wise matrix-vector product between a batch of MxN matrices and a batch of vectors of dimension N
+    and adds a batch of vectors of dimension M, each with batch size B. The addition is fused into the product, which
+    avoids allocating an intermediate tensor. Supports broadcasting for the batch dimension of the added vectors only.
+
+    Args:
+        bv1: A (B,M) tensor containing a batch of vectors that is added.
+        bm: A (B,M,N) tensor containing a batch of matrices.
+        bv2: A (B,N) tensor containing a batch of vectors.
+
+    Returns:
+        A (B,M) tensor containing the batch-wise matrix-vector product plus vector.
+    """
+    return torch.baddbmm(bv1.unsqueeze(dim=2), bm, bv2.unsqueeze(dim=2)).squeeze(dim=2)
+
+
 def bmm(bm1: torch.Tensor, bm2: torch.Tensor) -> torch.Tensor:
     """Batch-wise matrix-matrix product.
 
@@ -97,6 +116,73 @@ def bmm(bm1: torch.Tensor, bm2: torch.Tensor) -> torch.Tensor:
     return torch.matmul(bm1, bm2)
 
 
+def get_scripted_policy(policy: torch.nn.Module) -> torch.jit.ScriptModule:
+    """Get a scripted policy.
+
+    Compiles a policy with TorchScript and sets it to evaluation mode, which removes the Python interpreter overhead
+    from the forward pass. For inference with varying batch sizes, evaluate the scripted policy within
+    torch.jit.optimized_execution(False) to avoid the warmup of the profiling executor.
+
+    Args:
+        policy: An instance of a policy class.
+
+    Returns:
+        The scripted policy in evaluation mode.
+    """
+    return torch.jit.script(policy).eval()
+
+
+def get_compiled_policy(policy: torch.nn.Module, mode: str = "reduce-overhead") -> torch.nn.Module:
+    """Get a compiled policy.
+
+    Compiles the whole forward pass of a policy with torch.compile for static shapes, such that the operations are fused
+    into few kernels and, with the default mode on GPU, replayed as a CUDA graph. The policy is recompiled if it is
+    called with a different batch size. Compile after loading the weights, since the compiled policy shares them.
+
+    Args:
+        policy: An instance of a policy class.
+        mode: A string with the torch.compile mode, e.g. "reduce-overhead" or "max-autotune".
+
+    Returns:
+        The compiled policy.
+    """
+    return torch.compile(policy, mode=mode, fullgraph=True, dynamic=False)
+
+
+def get_reduced_precision_policy(policy: torch.nn.Module, dtype: torch.dtype = torch.bfloat16) -> torch.nn.Module:
+    """Get a reduced precision policy.
+
+    Creates a copy of a policy with parameters and buffers of a reduced precision data type and sets it to evaluation
+    mode, which halves the memory traffic of the forward pass. The observations are cast to this data type at the start
+    of the forward pass. On CPU, evaluate the policy within torch.autocast("cpu", dtype=torch.bfloat16) and on GPU
+    within torch.autocast("cuda", dtype=dtype) to use the corresponding hardware paths.
+
+    Args:
+        policy: An instance of a policy class.
+        dtype: The reduced precision PyTorch data type, e.g. torch.bfloat16 or torch.float16.
+
+    Returns:
+        The reduced precision copy of the policy in evaluation mode.
+    """
+    return copy.deepcopy(policy).to(dtype=dtype).eval()
+
+
+def get_dynamic_quantized_policy(policy: torch.nn.Module) -> torch.nn.Module:
+    """Get a dynamic quantized policy.
+
+    Creates a copy of a policy, where the linear layers are replaced by dynamic quantized linear layers with int8
+    weights, and sets it to evaluation mode. This is intended for inference on CPU. The stacked expert parameters of the
+    mixture of experts policies are not linear layers and therefore remain in floating point precision.
+
+    Args:
+        policy: An instance of a policy class.
+
+    Returns:
+        The dynamic quantized copy of the policy in evaluation mode.
+    """
+    return torch.ao.quantization.quantize_dynamic(policy, {torch.nn.Linear}, dtype=torch.qint8, inplace=False).eval()
+
+
 def get_size_array(data: np.ndarray) -> size_array:
     """Get an OCS2 size array.
 
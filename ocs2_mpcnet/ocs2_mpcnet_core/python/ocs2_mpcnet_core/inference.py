@@ -0,0 +1,133 @@
+###############################################################################
+# Copyright (c) 2022, Farbod Farshidian. All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#  * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+#  * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+#  * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+###############################################################################
+
+"""Inference classes.
+
+Provides classes for evaluating trained policies efficiently.
+"""
+
+import torch
+from typing import Tuple
+
+from ocs2_mpcnet_core.policy import BasePolicy
+
+
+class CudaGraphPolicy:
+    """CUDA graph policy.
+
+    Captures the forward pass of a policy for a fixed batch size as a CUDA graph and replays it at every call, which
+    replaces the launches of all individual kernels with a single graph launch.
+
+    Attributes:
+        policy: The captured policy.
+        static_observation: A (B,O) tensor with the static observations used as input of the CUDA graph.
+        static_predictions: A tuple with the static predictions used as output of the CUDA graph.
+        graph: The captured CUDA graph.
+    """
+
+    def __init__(self, policy: BasePolicy, batch_size: int, warmup_iterations: int = 3) -> None:
+        """Initializes the CudaGraphPolicy class.
+
+        Initializes the CudaGraphPolicy class by warming up the policy on a side stream and capturing its forward pass.
+
+        Args:
+            policy: An instance of a policy class with parameters and buffers on a CUDA device.
+            batch_size: An integer defining the fixed batch size B.
+            warmup_iterations: An integer defining the number of forward passes before the capture.
+        """
+        self.policy = policy
+        self.static_observation = torch.zeros(
+            batch_size,
+            policy.observation_scaling.shape[1],
+            device=policy.observation_scaling.device,
+            dtype=policy.observation_scaling.dtype,
+        )
+        # warm up on a side stream
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.no_grad(), torch.cuda.stream(stream):
+            for _ in range(warmup_iterations):
+                self.policy(self.static_observation)
+        torch.cuda.current_stream().wait_stream(stream)
+        # capture
+        self.graph = torch.cuda.CUDAGraph()
+        with torch.no_grad(), torch.cuda.graph(self.graph):
+            self.static_predictions = self.policy(self.static_observation)
+
+    def __call__(self, observation: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        """Call method.
+
+        Copies the observations into the static input and replays the CUDA graph. The returned tensors are overwritten
+        by the next call and have to be cloned if they should be kept.
+
+        Args:
+            observation: A (B,O) tensor with the observations.
+
+        Returns:
+            tuple: A tuple with the predictions, e.g. containing a (B,A) tensor with the predicted actions.
+        """
+        self.static_observation.copy_(observation)
+        self.graph.replay()
+        return self.static_predictions
+
+
+class PolicyRunner:
+    """Policy runner.
+
+    Evaluates a policy for inference, i.e. in evaluation mode and in inference mode, such that autograd neither records
+    the operations nor saves tensors for the backward pass and skips the version counter bookkeeping.
+
+    Attributes:
+        policy: The evaluated policy.
+    """
+
+    def __init__(self, policy: BasePolicy) -> None:
+        """Initializes the PolicyRunner class.
+
+        Initializes the PolicyRunner class by setting the policy to evaluation mode.
+
+        Args:
+            policy: An instance of a policy class.
+        """
+        self.policy = policy.eval()
+
+    def __call__(self, observation: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+        """Call method.
+
+        Evaluates the policy in inference mode. The returned tensors are inference tensors and can not be used in
+        autograd-recorded computations.
+
+        Args:
+            observation: A (B,O) tensor with the observations.
+
+        Returns:
+            tuple: A tuple with the predictions, e.g. containing a (B,A) tensor with the predicted actions.
+        """
+        with torch.inference_mode():
+            return self.policy(observation)
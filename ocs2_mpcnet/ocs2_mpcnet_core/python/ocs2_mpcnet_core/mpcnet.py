@@ -100,6 +100,8 @@ class Mpcnet(metaclass=ABCMeta):
         self.policy = policy
         self.policy.to(config.DEVICE)
         self.dummy_observation = torch.randn(1, config.OBSERVATION_DIM, device=config.DEVICE, dtype=config.DTYPE)
+        # highest ONNX opset supported by the ONNX Runtime version used for deployment
+        self.onnx_opset_version = 13
         # optimizer
         self.optimizer = torch.optim.Adam(self.policy.parameters(), lr=config.LEARNING_RATE)
 
@@ -123,6 +125,37 @@ class Mpcnet(metaclass=ABCMeta):
         """
         pass
 
+    def export_policy(self, policy: BasePolicy, policy_file_path: str) -> None:
+        """Export policy.
+
+        Export the policy to the Open Neural Network Exchange (ONNX) format for the deployment with ONNX Runtime in C++.
+
+        Args:
+            policy: The policy to export.
+            policy_file_path: The absolute path to the ONNX file.
+        """
+        torch.onnx.export(
+            model=policy,
+            args=self.dummy_observation,
+            f=policy_file_path,
+            input_names=["observation"],
+            output_names=["action"],
+            opset_version=self.onnx_opset_version,
+        )
+
+    def save_policy(self, save_path: str) -> None:
+        """Save policy.
+
+        Save the current policy as ONNX model for the deployment with ONNX Runtime, as pickled PyTorch module for Python
+        and as TorchScript module for the deployment with LibTorch, which can be loaded in C++ with torch::jit::load.
+
+        Args:
+            save_path: The absolute path to the files without file extension.
+        """
+        self.export_policy(self.policy, save_path + ".onnx")
+        torch.save(obj=self.policy, f=save_path + ".pt")
+        torch.jit.save(helper.get_scripted_policy(self.policy), save_path + "_scripted.pt")
+
     def start_data_generation(self, policy: BasePolicy, alpha: float = 1.0):
         """Start data generation.
 
@@ -133,7 +166,7 @@ class Mpcnet(metaclass=ABCMeta):
             alpha: The weight of the MPC policy in the rollouts.
         """
         policy_file_path = "/tmp/data_generation_" + datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".onnx"
-        torch.onnx.export(model=policy, args=self.dummy_observation, f=policy_file_path)
+        self.export_policy(policy, policy_file_path)
         initial_observations, mode_schedules, target_trajectories = self.get_tasks(
             self.config.DATA_GENERATION_TASKS, self.config.DATA_GENERATION_DURATION
         )
@@ -159,7 +192,7 @@ class Mpcnet(metaclass=ABCMeta):
             alpha: The weight of the MPC policy in the rollouts.
         """
         policy_file_path = "/tmp/policy_evaluation_" + datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".onnx"
-        torch.onnx.export(model=policy, args=self.dummy_observation, f=policy_file_path)
+        self.export_policy(policy, policy_file_path)
         initial_observations, mode_schedules, target_trajectories = self.get_tasks(
             self.config.POLICY_EVALUATION_TASKS, self.config.POLICY_EVALUATION_DURATION
         )
@@ -179,9 +212,7 @@ class Mpcnet(metaclass=ABCMeta):
         """
         try:
             # save initial policy
-            save_path = self.log_dir + "/initial_policy"
-            torch.onnx.export(model=self.policy, args=self.dummy_observation, f=save_path + ".onnx")
-            torch.save(obj=self.policy, f=save_path + ".pt")
+            self.save_policy(self.log_dir + "/initial_policy")
 
             print("==============\nWaiting for first data.\n==============")
             self.start_data_generation(self.policy)
@@ -238,9 +269,7 @@ class Mpcnet(metaclass=ABCMeta):
 
                 # save intermediate policy
                 if (iteration % int(0.1 * self.config.LEARNING_ITERATIONS) == 0) and (iteration > 0):
-                    save_path = self.log_dir + "/intermediate_policy_" + str(iteration)
-                    torch.onnx.export(model=self.policy, args=self.dummy_observation, f=save_path + ".onnx")
-                    torch.save(obj=self.policy, f=save_path + ".pt")
+                    self.save_policy(self.log_dir + "/intermediate_policy_" + str(iteration))
 
                 # extract batch from memory
                 (
@@ -265,7 +294,7 @@ class Mpcnet(metaclass=ABCMeta):
                     self.optimizer.zero_grad()
                     # prediction
                     action = self.policy(observation)[0]
-                    input = helper.bmv(action_transformation_matrix, action) + action_transformation_vector
+                    input = helper.baddbmv(action_transformation_vector, action_transformation_matrix, action)
                     # compute the empirical loss
                     empirical_loss = self.experts_loss(x, x, input, u, p, p, dHdxx, dHdux, dHduu, dHdx, dHdu, H)
                     # compute the gradients
@@ -284,7 +313,7 @@ class Mpcnet(metaclass=ABCMeta):
                     self.optimizer.zero_grad()
                     # prediction
                     action, weights = self.policy(observation)[:2]
-                    input = helper.bmv(action_transformation_matrix, action) + action_transformation_vector
+                    input = helper.baddbmv(action_transformation_vector, action_transformation_matrix, action)
                     # compute the empirical loss
                     empirical_experts_loss = self.experts_loss(x, x, input, u, p, p, dHdxx, dHdux, dHduu, dHdx, dHdu, H)
                     empirical_gating_loss = self.gating_loss(x, x, u, u, weights, p, dHdxx, dHdux, dHduu, dHdx, dHdu, H)
@@ -315,9 +344,7 @@ class Mpcnet(metaclass=ABCMeta):
             print("==============\nTraining completed.\n==============")
 
             # save final policy
-            save_path = self.log_dir + "/final_policy"
-            torch.onnx.export(model=self.policy, args=self.dummy_observation, f=save_path + ".onnx")
-            torch.save(obj=self.policy, f=save_path + ".pt")
+            self.save_policy(self.log_dir + "/final_policy")
 
         except KeyboardInterrupt:
             # let data generation and policy evaluation finish (to avoid a segmentation fault)
@@ -37,7 +37,6 @@ from typing import Tuple
 from abc import ABCMeta, abstractmethod
 
 from ocs2_mpcnet_core.config import Config
-from ocs2_mpcnet_core.helper import bmv
 
 
 class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
@@ -46,8 +45,8 @@ class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
     Provides the interface to all policy classes.
 
     Attributes:
-        observation_scaling: A (1,O,O) tensor for the observation scaling.
-        action_scaling: A (1,A,A) tensor for the action scaling.
+        observation_scaling: A (1,O) buffer tensor with the diagonal of the observation scaling matrix.
+        action_scaling: A (1,A) buffer tensor with the diagonal of the action scaling matrix.
     """
 
     def __init__(self, config: Config) -> None:
@@ -59,11 +58,15 @@ class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
             config: An instance of the configuration class.
         """
         super().__init__()
-        self.observation_scaling = (
-            torch.tensor(config.OBSERVATION_SCALING, device=config.DEVICE, dtype=config.DTYPE).diag().unsqueeze(dim=0)
+        self.register_buffer(
+            "observation_scaling",
+            torch.tensor(config.OBSERVATION_SCALING, device=config.DEVICE, dtype=config.DTYPE).unsqueeze(dim=0),
+            persistent=False,
         )
-        self.action_scaling = (
-            torch.tensor(config.ACTION_SCALING, device=config.DEVICE, dtype=config.DTYPE).diag().unsqueeze(dim=0)
+        self.register_buffer(
+            "action_scaling",
+            torch.tensor(config.ACTION_SCALING, device=config.DEVICE, dtype=config.DTYPE).unsqueeze(dim=0),
+            persistent=False,
         )
 
     @abstractmethod
@@ -83,7 +86,8 @@ class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
     def scale_observation(self, observation: torch.Tensor) -> torch.Tensor:
         """Scale observation.
 
-        Scale the observation with a fixed diagonal matrix.
+        Scale the observation with a fixed diagonal matrix, which is applied as an element-wise product with its
+        diagonal. The observation is cast to the data type of the policy, e.g. for inference with reduced precision.
 
         Args:
             observation: A (B,O) tensor with the observations.
@@ -91,12 +95,14 @@ class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
         Returns:
             scaled_observation: A (B,O) tensor with the scaled observations.
         """
-        return bmv(self.observation_scaling, observation)
+        if observation.dtype != self.observation_scaling.dtype:
+            observation = observation.to(dtype=self.observation_scaling.dtype)
+        return torch.mul(self.observation_scaling, observation)
 
     def scale_action(self, action: torch.Tensor) -> torch.Tensor:
         """Scale action.
 
-        Scale the action with a fixed diagonal matrix.
+        Scale the action with a fixed diagonal matrix, which is applied as an element-wise product with its diagonal.
 
         Args:
             action: A (B,A) tensor with the actions.
@@ -104,4 +110,4 @@ class BasePolicy(torch.nn.Module, metaclass=ABCMeta):
         Returns:
             scaled_action: A (B,A) tensor with the scaled actions.
         """
-        return bmv(self.action_scaling, action)
+        return torch.mul(self.action_scaling, action)
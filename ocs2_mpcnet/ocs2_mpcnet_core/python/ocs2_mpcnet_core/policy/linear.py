@@ -33,7 +33,7 @@ Provides a class that implements a linear policy.
 """
 
 import torch
-from typing import Tuple
+from typing import Final, Tuple
 
 from ocs2_mpcnet_core.config import Config
 from ocs2_mpcnet_core.policy.base import BasePolicy
@@ -51,6 +51,9 @@ class LinearPolicy(BasePolicy):
         linear: The linear neural network layer.
     """
 
+    observation_dimension: Final[int]
+    action_dimension: Final[int]
+
     def __init__(self, config: Config) -> None:
         """Initializes the LinearPolicy class.
 
@@ -29,31 +29,37 @@
 
 """Mixture of linear experts policy.
 
-Provides classes that implement a mixture of linear experts policy.
+Provides a class that implements a mixture of linear experts policy.
 """
 
+import math
 import torch
-from typing import Tuple
+from typing import Any, Dict, Final, List, Tuple
 
 from ocs2_mpcnet_core.config import Config
 from ocs2_mpcnet_core.policy.base import BasePolicy
-from ocs2_mpcnet_core.helper import bmv
 
 
 class MixtureOfLinearExpertsPolicy(BasePolicy):
     """Mixture of linear experts policy.
 
-    Class for a mixture of experts neural network policy with linear experts.
+    Class for a mixture of experts neural network policy with linear experts. The parameters of all linear experts are
+    stored in stacked tensors, such that all experts are evaluated with a single batched matrix multiplication.
 
     Attributes:
         name: A string with the name of the policy.
         observation_dimension: An integer defining the observation (i.e. input) dimension of the policy.
         action_dimension: An integer defining the action (i.e. output) dimension of the policy.
         expert_number: An integer defining the number of experts.
-        gating_net: The gating network.
-        expert_nets: The expert networks.
+        gating_net: The gating network that computes the logits of the expert weights.
+        expert_linear_weight: A (E,A,O) parameter tensor with the weights of the linear experts.
+        expert_linear_bias: A (E,A) parameter tensor with the biases of the linear experts.
     """
 
+    observation_dimension: Final[int]
+    action_dimension: Final[int]
+    expert_number: Final[int]
+
     def __init__(self, config: Config) -> None:
         """Initializes the MixtureOfLinearExpertsPolicy class.
 
@@ -68,12 +74,45 @@ class MixtureOfLinearExpertsPolicy(BasePolicy):
         self.action_dimension = config.ACTION_DIM
         self.expert_number = config.EXPERT_NUM
         # gating
-        self.gating_net = torch.nn.Sequential(
-            torch.nn.Linear(self.observation_dimension, self.expert_number), torch.nn.Softmax(dim=1)
-        )
+        self.gating_net = torch.nn.Sequential(torch.nn.Linear(self.observation_dimension, self.expert_number))
         # experts
-        self.expert_nets = torch.nn.ModuleList(
-            [_LinearExpert(i, self.observation_dimension, self.action_dimension) for i in range(self.expert_number)]
+        self.expert_linear_weight = torch.nn.Parameter(
+            torch.empty(self.expert_number, self.action_dimension, self.observation_dimension)
+        )
+        self.expert_linear_bias = torch.nn.Parameter(torch.empty(self.expert_number, self.action_dimension))
+        self.reset_expert_parameters()
+
+    def reset_expert_parameters(self) -> None:
+        """Reset expert parameters.
+
+        Initializes the parameters of each linear expert in the same way as torch.nn.Linear does.
+        """
+        bound = 1.0 / math.sqrt(self.observation_dimension)
+        for i in range(self.expert_number):
+            torch.nn.init.kaiming_uniform_(self.expert_linear_weight[i], a=math.sqrt(5))
+            torch.nn.init.uniform_(self.expert_linear_bias[i], -bound, bound)
+
+    def _load_from_state_dict(
+        self,
+        state_dict: Dict[str, torch.Tensor],
+        prefix: str,
+        local_metadata: Dict[str, Any],
+        strict: bool,
+        missing_keys: List[str],
+        unexpected_keys: List[str],
+        error_msgs: List[str],
+    ) -> None:
+        """Load from state dict.
+
+        Consolidates the parameters of a state dict with one network per expert, as stored by previous versions of this
+        class with the keys expert_nets.<i>.linear.<weight|bias>, into the stacked expert parameters before loading.
+        """
+        for parameter in ("weight", "bias"):
+            keys = [f"{prefix}expert_nets.{i}.linear.{parameter}" for i in range(self.expert_number)]
+            if all(key in state_dict for key in keys):
+                state_dict[f"{prefix}expert_linear_{parameter}"] = torch.stack([state_dict.pop(key) for key in keys])
+        super()._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
         )
 
     def forward(self, observation: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
@@ -89,52 +128,9 @@ class MixtureOfLinearExpertsPolicy(BasePolicy):
             expert_weights: A (B,E) tensor with the predicted expert weights.
         """
         scaled_observation = self.scale_observation(observation)
-        expert_weights = self.gating_net(scaled_observation)
-        expert_actions = torch.stack(
-            [self.expert_nets[i](scaled_observation) for i in range(self.expert_number)], dim=2
-        )
-        unscaled_action = bmv(expert_actions, expert_weights)
+        expert_weights = torch.softmax(self.gating_net(scaled_observation), dim=1)
+        expert_actions = torch.einsum("eao,bo->bae", self.expert_linear_weight, scaled_observation)
+        expert_actions = expert_actions + self.expert_linear_bias.t()
+        unscaled_action = torch.sum(expert_actions * expert_weights.unsqueeze(dim=1), dim=2)
         action = self.scale_action(unscaled_action)
         return action, expert_weights
-
-
-class _LinearExpert(torch.nn.Module):
-    """Linear expert.
-
-    Class for a simple linear neural network expert.
-
-    Attributes:
-        name: A string with the name of the expert.
-        input_dimension: An integer defining the input dimension of the expert.
-        output_dimension: An integer defining the output dimension of the expert.
-        linear: The linear neural network layer.
-    """
-
-    def __init__(self, index: int, input_dimension: int, output_dimension: int) -> None:
-        """Initializes the _LinearExpert class.
-
-        Initializes the _LinearExpert class by setting fixed and variable attributes.
-
-        Args:
-            index: An integer with the index of the expert.
-            input_dimension: An integer defining the input dimension of the expert.
-            output_dimension: An integer defining the output dimension of the expert.
-        """
-        super().__init__()
-        self.name = "LinearExpert" + str(index)
-        self.input_dimension = input_dimension
-        self.output_dimension = output_dimension
-        self.linear = torch.nn.Linear(self.input_dimension, self.output_dimension)
-
-    def forward(self, input: torch.Tensor) -> torch.Tensor:
-        """Forward method.
-
-        Defines the computation performed at every call. Computes the output tensors from the input tensors.
-
-        Args:
-            input: A (B,I) tensor with the inputs.
-
-        Returns:
-            output: A (B,O) tensor with the outputs.
-        """
-        return self.linear(input)
@@ -29,22 +29,23 @@
 
 """Mixture of nonlinear experts policy.
 
-Provides classes that implement a mixture of nonlinear experts policy.
+Provides a class that implements a mixture of nonlinear experts policy.
 """
 
+import math
 import torch
-from typing import Tuple
+from typing import Any, Dict, Final, List, Tuple
 
 from ocs2_mpcnet_core.config import Config
 from ocs2_mpcnet_core.policy.base import BasePolicy
-from ocs2_mpcnet_core.helper import bmv
 
 
 class MixtureOfNonlinearExpertsPolicy(BasePolicy):
     """Mixture of nonlinear experts policy.
 
     Class for a mixture of experts neural network policy with nonlinear experts, where the hidden layer dimension is the
-    mean of the input and output dimensions.
+    mean of the input and output dimensions. The parameters of all nonlinear experts are stored in stacked tensors, such
+    that each layer of all experts is evaluated with a single batched matrix multiplication.
 
     Attributes:
         name: A string with the name of the policy.
@@ -53,10 +54,20 @@ class MixtureOfNonlinearExpertsPolicy(BasePolicy):
         expert_hidden_dimension: An integer defining the dimension of the hidden layer for the expert networks.
         action_dimension: An integer defining the action (i.e. output) dimension of the policy.
         expert_number: An integer defining the number of experts.
-        gating_net: The gating network.
-        expert_nets: The expert networks.
+        gating_net: The gating network that computes the logits of the expert weights.
+        expert_linear1_weight: A (E,H,O) parameter tensor with the weights of the first linear layer of the experts.
+        expert_linear1_bias: A (E,H) parameter tensor with the biases of the first linear layer of the experts.
+        expert_activation: The activation to get the hidden layer of the experts.
+        expert_linear2_weight: A (E,A,H) parameter tensor with the weights of the second linear layer of the experts.
+        expert_linear2_bias: A (E,A) parameter tensor with the biases of the second linear layer of the experts.
     """
 
+    observation_dimension: Final[int]
+    gating_hidden_dimension: Final[int]
+    expert_hidden_dimension: Final[int]
+    action_dimension: Final[int]
+    expert_number: Final[int]
+
     def __init__(self, config: Config) -> None:
         """Initializes the MixtureOfNonlinearExpertsPolicy class.
 
@@ -77,14 +88,57 @@ class MixtureOfNonlinearExpertsPolicy(BasePolicy):
             torch.nn.Linear(self.observation_dimension, self.gating_hidden_dimension),
             torch.nn.Tanh(),
             torch.nn.Linear(self.gating_hidden_dimension, self.expert_number),
-            torch.nn.Softmax(dim=1),
         )
         # experts
-        self.expert_nets = torch.nn.ModuleList(
-            [
-                _NonlinearExpert(i, self.observation_dimension, self.expert_hidden_dimension, self.action_dimension)
-                for i in range(self.expert_number)
-            ]
+        self.expert_linear1_weight = torch.nn.Parameter(
+            torch.empty(self.expert_number, self.expert_hidden_dimension, self.observation_dimension)
+        )
+        self.expert_linear1_bias = torch.nn.Parameter(torch.empty(self.expert_number, self.expert_hidden_dimension))
+        self.expert_activation = torch.nn.Tanh()
+        self.expert_linear2_weight = torch.nn.Parameter(
+            torch.empty(self.expert_number, self.action_dimension, self.expert_hidden_dimension)
+        )
+        self.expert_linear2_bias = torch.nn.Parameter(torch.empty(self.expert_number, self.action_dimension))
+        self.reset_expert_parameters()
+
+    def reset_expert_parameters(self) -> None:
+        """Reset expert parameters.
+
+        Initializes the parameters of each layer of each nonlinear expert in the same way as torch.nn.Linear does.
+        """
+        bound1 = 1.0 / math.sqrt(self.observation_dimension)
+        bound2 = 1.0 / math.sqrt(self.expert_hidden_dimension)
+        for i in range(self.expert_number):
+            torch.nn.init.kaiming_uniform_(self.expert_linear1_weight[i], a=math.sqrt(5))
+            torch.nn.init.uniform_(self.expert_linear1_bias[i], -bound1, bound1)
+            torch.nn.init.kaiming_uniform_(self.expert_linear2_weight[i], a=math.sqrt(5))
+            torch.nn.init.uniform_(self.expert_linear2_bias[i], -bound2, bound2)
+
+    def _load_from_state_dict(
+        self,
+        state_dict: Dict[str, torch.Tensor],
+        prefix: str,
+        local_metadata: Dict[str, Any],
+        strict: bool,
+        missing_keys: List[str],
+        unexpected_keys: List[str],
+        error_msgs: List[str],
+    ) -> None:
+        """Load from state dict.
+
+        Consolidates the parameters of a state dict with one network per expert, as stored by previous versions of this
+        class with the keys expert_nets.<i>.<linear1|linear2>.<weight|bias>, into the stacked expert parameters before
+        loading.
+        """
+        for layer in ("linear1", "linear2"):
+            for parameter in ("weight", "bias"):
+                keys = [f"{prefix}expert_nets.{i}.{layer}.{parameter}" for i in range(self.expert_number)]
+                if all(key in state_dict for key in keys):
+                    state_dict[f"{prefix}expert_{layer}_{parameter}"] = torch.stack(
+                        [state_dict.pop(key) for key in keys]
+                    )
+        super()._load_from_state_dict(
+            state_dict, prefix, local_metadata, strict, missing_keys, unexpected_keys, error_msgs
         )
 
     def forward(self, observation: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
@@ -100,60 +154,11 @@ class MixtureOfNonlinearExpertsPolicy(BasePolicy):
             expert_weights: A (B,E) tensor with the predicted expert weights.
         """
         scaled_observation = self.scale_observation(observation)
-        expert_weights = self.gating_net(scaled_observation)
-        expert_actions = torch.stack(
-            [self.expert_nets[i](scaled_observation) for i in range(self.expert_number)], dim=2
-        )
-        unscaled_action = bmv(expert_actions, expert_weights)
+        expert_weights = torch.softmax(self.gating_net(scaled_observation), dim=1)
+        expert_hidden = torch.einsum("eho,bo->beh", self.expert_linear1_weight, scaled_observation)
+        expert_hidden = self.expert_activation(expert_hidden + self.expert_linear1_bias)
+        expert_actions = torch.einsum("eah,beh->bae", self.expert_linear2_weight, expert_hidden)
+        expert_actions = expert_actions + self.expert_linear2_bias.t()
+        unscaled_action = torch.sum(expert_actions * expert_weights.unsqueeze(dim=1), dim=2)
         action = self.scale_action(unscaled_action)
         return action, expert_weights
-
-
-class _NonlinearExpert(torch.nn.Module):
-    """Nonlinear expert.
-
-    Class for a simple nonlinear neural network expert, where the hidden layer dimension is the mean of the input and
-    output dimensions.
-
-    Attributes:
-        name: A string with the name of the expert.
-        input_dimension: An integer defining the input dimension of the expert.
-        hidden_dimension: An integer defining the dimension of the hidden layer.
-        output_dimension: An integer defining the output dimension of the expert.
-        linear1: The first linear neural network layer.
-        activation: The activation to get the hidden layer.
-        linear2: The second linear neural network layer.
-    """
-
-    def __init__(self, index: int, input_dimension: int, hidden_dimension: int, output_dimension: int) -> None:
-        """Initializes the _NonlinearExpert class.
-
-        Initializes the _NonlinearExpert class by setting fixed and variable attributes.
-
-        Args:
-            index: An integer with the index of the expert.
-            input_dimension: An integer defining the input dimension of the expert.
-            hidden_dimension: An integer defining the dimension of the hidden layer.
-            output_dimension: An integer defining the output dimension of the expert.
-        """
-        super().__init__()
-        self.name = "NonlinearExpert" + str(index)
-        self.input_dimension = input_dimension
-        self.hidden_dimension = hidden_dimension
-        self.output_dimension = output_dimension
-        self.linear1 = torch.nn.Linear(self.input_dimension, self.hidden_dimension)
-        self.activation = torch.nn.Tanh()
-        self.linear2 = torch.nn.Linear(self.hidden_dimension, self.output_dimension)
-
-    def forward(self, input: torch.Tensor) -> torch.Tensor:
-        """Forward method.
-
-        Defines the computation performed at every call. Computes the output tensors from the input tensors.
-
-        Args:
-            input: A (B,I) tensor with the inputs.
-
-        Returns:
-            output: A (B,O) tensor with the outputs.
-        """
-        return self.linear2(self.activation(self.linear1(input)))
@@ -33,7 +33,7 @@ Provides a class that implements a nonlinear policy.
 """
 
 import torch
-from typing import Tuple
+from typing import Final, Tuple
 
 from ocs2_mpcnet_core.config import Config
 from ocs2_mpcnet_core.policy.base import BasePolicy
@@ -55,6 +55,10 @@ class NonlinearPolicy(BasePolicy):
         linear2: The second linear neural network layer.
     """
 
+    observation_dimension: Final[int]
+    hidden_dimension: Final[int]
+    action_dimension: Final[int]
+
     def __init__(self, config: Config) -> None:
         """Initializes the NonlinearPolicy class.
 
@@ -29,6 +29,9 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 #include "ocs2_mpcnet_core/control/MpcnetOnnxController.h"
 
+#include <functional>
+#include <numeric>
+
 namespace ocs2 {
 namespace mpcnet {
 
@@ -56,6 +59,19 @@ void MpcnetOnnxController::loadPolicyModel(const std::string& policyFilePath) {
     outputNames_.push_back(sessionPtr_->GetOutputName(i, allocator));
     outputShapes_.push_back(sessionPtr_->GetOutputTypeInfo(i).GetTensorTypeAndShapeInfo().GetShape());
   }
+  // preallocate input and output tensors
+  const auto getNumberOfElements = [](const std::vector<int64_t>& shape) {
+    return std::accumulate(shape.begin(), shape.end(), int64_t(1), std::multiplies<int64_t>());
+  };
+  observation_.setZero(getNumberOfElements(inputShapes_[0]));
+  action_.setZero(getNumberOfElements(outputShapes_[0]));
+  Ort::MemoryInfo memoryInfo = Ort::MemoryInfo::CreateCpu(OrtAllocatorType::OrtArenaAllocator, OrtMemType::OrtMemTypeDefault);
+  inputValues_.clear();
+  outputValues_.clear();
+  inputValues_.push_back(Ort::Value::CreateTensor<tensor_element_t>(memoryInfo, observation_.data(), observation_.size(),
+                                                                    inputShapes_[0].data(), inputShapes_[0].size()));
+  outputValues_.push_back(Ort::Value::CreateTensor<tensor_element_t>(memoryInfo, action_.data(), action_.size(),
+                                                                     outputShapes_[0].data(), outputShapes_[0].size()));
 }
 
 /******************************************************************************************************/
@@ -65,24 +81,20 @@ vector_t MpcnetOnnxController::computeInput(const scalar_t t, const vector_t& x)
   if (sessionPtr_ == nullptr) {
     throw std::runtime_error("[MpcnetOnnxController::computeInput] cannot compute input, since policy model is not loaded.");
   }
-  // create input tensor object
-  Eigen::Matrix<tensor_element_t, Eigen::Dynamic, 1> observation =
-      mpcnetDefinitionPtr_->getObservation(t, x, referenceManagerPtr_->getModeSchedule(), referenceManagerPtr_->getTargetTrajectories())
-          .cast<tensor_element_t>();
-  Ort::MemoryInfo memoryInfo = Ort::MemoryInfo::CreateCpu(OrtAllocatorType::OrtArenaAllocator, OrtMemType::OrtMemTypeDefault);
-  std::vector<Ort::Value> inputValues;
-  inputValues.push_back(Ort::Value::CreateTensor<tensor_element_t>(memoryInfo, observation.data(), observation.size(),
-                                                                   inputShapes_[0].data(), inputShapes_[0].size()));
-  // run inference
+  // fill preallocated input tensor
+  const vector_t observation =
+      mpcnetDefinitionPtr_->getObservation(t, x, referenceManagerPtr_->getModeSchedule(), referenceManagerPtr_->getTargetTrajectories());
+  if (observation.size() != observation_.size()) {
+    throw std::runtime_error("[MpcnetOnnxController::computeInput] observation dimension does not match policy model.");
+  }
+  observation_ = observation.cast<tensor_element_t>();
+  // run inference into preallocated output tensor
   Ort::RunOptions runOptions;
-  std::vector<Ort::Value> outputValues = sessionPtr_->Run(runOptions, inputNames_.data(), inputValues.data(), 1, outputNames_.data(), 1);
-  // evaluate output tensor object
-  Eigen::Map<Eigen::Matrix<tensor_element_t, Eigen::Dynamic, 1>> action(outputValues[0].GetTensorMutableData<tensor_element_t>(),
-                                                                        outputShapes_[0][1], outputShapes_[0][0]);
+  sessionPtr_->Run(runOptions, inputNames_.data(), inputValues_.data(), 1, outputNames_.data(), outputValues_.data(), 1);
   std::pair<matrix_t, vector_t> actionTransformation = mpcnetDefinitionPtr_->getActionTransformation(
       t, x, referenceManagerPtr_->getModeSchedule(), referenceManagerPtr_->getTargetTrajectories());
   // transform action
-  return actionTransformation.first * action.cast<scalar_t>() + actionTransformation.second;
+  return actionTransformation.first * action_.cast<scalar_t>() + actionTransformation.second;
 }
 
 }  // namespace mpcnet
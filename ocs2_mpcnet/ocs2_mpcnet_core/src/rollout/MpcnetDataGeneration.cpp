@@ -67,12 +67,12 @@ const data_array_t* MpcnetDataGeneration::run(scalar_t alpha, const std::string&
       if (iteration % dataDecimation == 0) {
         // get nominal data point
         const vector_t deviation = vector_t::Zero(primalSolution_.stateTrajectory_.front().size());
-        dataArray_.push_back(getDataPoint(*mpcPtr_, *mpcnetDefinitionPtr_, deviation));
+        dataArray_.push_back(getDataPoint(*mpcPtr_, *mpcnetDefinitionPtr_, primalSolution_, deviation));
 
         // get samples around nominal data point
         for (int i = 0; i < nSamples; i++) {
           const vector_t deviation = L * vector_t::NullaryExpr(primalSolution_.stateTrajectory_.front().size(), standardNormalNullaryOp);
-          dataArray_.push_back(getDataPoint(*mpcPtr_, *mpcnetDefinitionPtr_, deviation));
+          dataArray_.push_back(getDataPoint(*mpcPtr_, *mpcnetDefinitionPtr_, primalSolution_, deviation));
         }
       }
 